@@ -51,6 +51,7 @@ class TransformersSimilarityRanker:
         calibration_factor: Optional[float] = 1.0,
         score_threshold: Optional[float] = None,
         model_kwargs: Optional[Dict[str, Any]] = None,
+        batch_size: int = 16,
     ):
         """
         Creates an instance of TransformersSimilarityRanker.
@@ -83,11 +84,16 @@ class TransformersSimilarityRanker:
             If provided only returns documents with a score above this threshold.
         :param model_kwargs: Additional keyword arguments passed to `AutoModelForSequenceClassification.from_pretrained`
             when loading the model specified in `model`. For details on what kwargs you can pass,
-            see the model's documentation.
+            see the model's documentation. On GPUs, passing `{"torch_dtype": torch.float16}` (or `torch.bfloat16`)
+            roughly halves memory usage and speeds up inference with a negligible effect on the ranking.
+        :param batch_size:
+            The number of query-Document pairs the model scores at once. Larger batches are faster on GPUs but need
+            more memory.
 
         :raises ValueError:
             If `top_k` is not > 0.
             If `scale_score` is True and `calibration_factor` is not provided.
+            If `batch_size` is not > 0.
         """
         torch_and_transformers_import.check()
 
@@ -104,6 +110,7 @@ class TransformersSimilarityRanker:
         self.scale_score = scale_score
         self.calibration_factor = calibration_factor
         self.score_threshold = score_threshold
+        self.batch_size = batch_size
 
         model_kwargs = resolve_hf_device_map(device=device, model_kwargs=model_kwargs)
         self.model_kwargs = model_kwargs
@@ -117,6 +124,9 @@ class TransformersSimilarityRanker:
         if self.top_k <= 0:
             raise ValueError(f"top_k must be > 0, but got {top_k}")
 
+        if self.batch_size <= 0:
+            raise ValueError(f"batch_size must be > 0, but got {batch_size}")
+
     def _get_telemetry_data(self) -> Dict[str, Any]:
         """
         Data that is sent to Posthog for usage analytics.
@@ -157,6 +167,7 @@ class TransformersSimilarityRanker:
             calibration_factor=self.calibration_factor,
             score_threshold=self.score_threshold,
             model_kwargs=self.model_kwargs,
+            batch_size=self.batch_size,
         )
 
         serialize_hf_model_kwargs(serialization_dict["init_parameters"]["model_kwargs"])
@@ -247,13 +258,18 @@ class TransformersSimilarityRanker:
             text_to_embed = self.embedding_separator.join(meta_values_to_embed + [doc.content or ""])
             query_doc_pairs.append([self.query_prefix + query, self.document_prefix + text_to_embed])
 
-        features = self.tokenizer(
-            query_doc_pairs, padding=True, truncation=True, return_tensors="pt"
-        ).to(  # type: ignore
-            self.device.first_device.to_torch()
-        )
+        # Tokenizing each batch separately pads the pairs only to the longest one in the batch
+        batch_scores = []
         with torch.inference_mode():
-            similarity_scores = self.model(**features).logits.squeeze(dim=1)  # type: ignore
+            for start in range(0, len(query_doc_pairs), self.batch_size):
+                features = self.tokenizer(
+                    query_doc_pairs[start : start + self.batch_size], padding=True, truncation=True, return_tensors="pt"
+                ).to(  # type: ignore
+                    self.device.first_device.to_torch()
+                )
+                batch_scores.append(self.model(**features).logits.squeeze(dim=1))  # type: ignore
+        # Models loaded in half precision return float16 logits, upcast them so scaling and sorting keep their range
+        similarity_scores = torch.cat(batch_scores).float()
 
         if scale_score:
             similarity_scores = torch.sigmoid(similarity_scores * calibration_factor)
@@ -561,20 +561,21 @@ class ExtractiveReader:
         start_logits_list = []
         end_logits_list = []
 
-        for i in range(num_batches):
-            start_index = i * batch_size
-            end_index = start_index + batch_size
-            cur_input_ids = input_ids[start_index:end_index]
-            cur_attention_mask = attention_mask[start_index:end_index]
-
-            output = self.model(input_ids=cur_input_ids, attention_mask=cur_attention_mask)
-            cur_start_logits = output.start_logits
-            cur_end_logits = output.end_logits
-            if num_batches != 1:
-                cur_start_logits = cur_start_logits.cpu()
-                cur_end_logits = cur_end_logits.cpu()
-            start_logits_list.append(cur_start_logits)
-            end_logits_list.append(cur_end_logits)
+        with torch.inference_mode():
+            for i in range(num_batches):
+                start_index = i * batch_size
+                end_index = start_index + batch_size
+                cur_input_ids = input_ids[start_index:end_index]
+                cur_attention_mask = attention_mask[start_index:end_index]
+
+                output = self.model(input_ids=cur_input_ids, attention_mask=cur_attention_mask)
+                cur_start_logits = output.start_logits
+                cur_end_logits = output.end_logits
+                if num_batches != 1:
+                    cur_start_logits = cur_start_logits.cpu()
+                    cur_end_logits = cur_end_logits.cpu()
+                start_logits_list.append(cur_start_logits)
+                end_logits_list.append(cur_end_logits)
 
         start_logits = torch.cat(start_logits_list)
         end_logits = torch.cat(end_logits_list)
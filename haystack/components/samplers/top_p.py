@@ -1,15 +1,12 @@
 from typing import List, Optional
 
+import numpy as np
+
 from haystack import ComponentError, Document, component, logging
-from haystack.lazy_imports import LazyImport
 
 logger = logging.getLogger(__name__)
 
 
-with LazyImport(message="Run 'pip install \"torch>=1.13\"'") as torch_import:
-    import torch
-
-
 @component
 class TopPSampler:
     """
@@ -47,8 +44,6 @@ class TopPSampler:
         :param score_field: Name of the field in each document's metadata that contains the score. If None, the default
             document score field is used.
         """
-        torch_import.check()
-
         self.top_p = top_p
         self.score_field = score_field
 
@@ -75,27 +70,32 @@ class TopPSampler:
         if not 0 <= top_p <= 1:
             raise ValueError(f"top_p must be between 0 and 1. Got {top_p}.")
 
-        similarity_scores = torch.tensor(self._collect_scores(documents), dtype=torch.float32)
+        similarity_scores = np.asarray(self._collect_scores(documents), dtype=np.float64)
 
-        # Apply softmax normalization to the similarity scores
-        probs = torch.nn.functional.softmax(similarity_scores, dim=-1)
+        # Softmax preserves the order of the scores, so sorting them also sorts the probabilities
+        sorted_indices = np.argsort(-similarity_scores, kind="stable")
 
-        # Sort the probabilities and calculate their cumulative sum
-        sorted_probs, sorted_indices = torch.sort(probs, descending=True)
-        cumulative_probs = torch.cumsum(sorted_probs, dim=-1)
+        # With top_p=1.0, or a single document, every document is kept and there's no need to compute probabilities
+        if top_p >= 1.0 or len(documents) == 1:
+            return {"documents": [documents[i] for i in sorted_indices]}
+
+        # Apply softmax normalization to the similarity scores, shifting them by their maximum to avoid overflows
+        exp_scores = np.exp(similarity_scores - np.max(similarity_scores))
+        probs = exp_scores / np.sum(exp_scores)
+
+        # Calculate the cumulative sum of the sorted probabilities
+        sorted_probs = probs[sorted_indices]
+        cumulative_probs = np.cumsum(sorted_probs)
 
         # Check if the cumulative probabilities are close to top_p with a 1e-6 tolerance
-        close_to_top_p = torch.isclose(cumulative_probs, torch.tensor(top_p, device=cumulative_probs.device), atol=1e-6)
+        close_to_top_p = np.isclose(cumulative_probs, top_p, atol=1e-6)
 
         # Combine the close_to_top_p with original condition using logical OR
         condition = (cumulative_probs <= top_p) | close_to_top_p
 
-        # Find the indices with cumulative probabilities that exceed top_p
-        top_p_indices = torch.where(torch.BoolTensor(condition))[0]
-
-        # Map the selected indices back to their original indices
-        original_indices = sorted_indices[top_p_indices]
-        selected_docs = [documents[i.item()] for i in original_indices]
+        # The cumulative probabilities never decrease, so the documents within top_p are the first ones in sorted order
+        num_selected = int(np.count_nonzero(condition))
+        selected_docs = [documents[i] for i in sorted_indices[:num_selected]]
 
         # If low p resulted in no documents being selected, then
         # return at least one document
@@ -105,8 +105,7 @@ class TopPSampler:
                 "Returning the document with the highest similarity score.",
                 top_p=top_p,
             )
-            highest_prob_indices = torch.argsort(probs, descending=True)
-            selected_docs = [documents[int(highest_prob_indices[0].item())]]
+            selected_docs = [documents[sorted_indices[0]]]
 
         return {"documents": selected_docs}
 
@@ -1,5 +1,7 @@
 import re
-from typing import Any, Dict, Iterable, List, Literal, Optional
+from copy import deepcopy
+from dataclasses import replace
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
 
 import numpy as np
 from haystack_bm25 import rank_bm25
@@ -51,13 +53,19 @@ class InMemoryDocumentStore:
         """
         self.storage: Dict[str, Document] = {}
         self._bm25_tokenization_regex = bm25_tokenization_regex
-        self.tokenizer = re.compile(bm25_tokenization_regex).findall
+        # Matching case-insensitively lets us lowercase the tokens instead of the whole text
+        self.tokenizer = re.compile(bm25_tokenization_regex, re.IGNORECASE).findall
         algorithm_class = getattr(rank_bm25, bm25_algorithm)
         if algorithm_class is None:
             raise ValueError(f"BM25 algorithm '{bm25_algorithm}' not found.")
         self.bm25_algorithm = algorithm_class
         self.bm25_parameters = bm25_parameters or {}
         self.embedding_similarity_function = embedding_similarity_function
+        # Bumped on every change to the stored documents, used to invalidate the cached BM25 index
+        self._corpus_version = 0
+        self._bm25_cache: Optional[Tuple[Tuple[Any, ...], List[Document], rank_bm25.BM25]] = None
+        # Text extracted from the dataframes of table Documents, keyed by Document ID
+        self._table_text_cache: Dict[str, str] = {}
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -90,7 +98,7 @@ class InMemoryDocumentStore:
         """
         Returns the number of how many documents are present in the DocumentStore.
         """
-        return len(self.storage.keys())
+        return len(self.storage)
 
     def filter_documents(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -125,7 +133,7 @@ class InMemoryDocumentStore:
 
         written_documents = len(documents)
         for document in documents:
-            if policy != DuplicatePolicy.OVERWRITE and document.id in self.storage.keys():
+            if policy != DuplicatePolicy.OVERWRITE and document.id in self.storage:
                 if policy == DuplicatePolicy.FAIL:
                     raise DuplicateDocumentError(f"ID '{document.id}' already exists.")
                 if policy == DuplicatePolicy.SKIP:
@@ -133,6 +141,8 @@ class InMemoryDocumentStore:
                     written_documents -= 1
                     continue
             self.storage[document.id] = document
+            self._table_text_cache.pop(document.id, None)
+            self._corpus_version += 1
         return written_documents
 
     def delete_documents(self, document_ids: List[str]) -> None:
@@ -142,9 +152,9 @@ class InMemoryDocumentStore:
         :param document_ids: The object_ids to delete.
         """
         for doc_id in document_ids:
-            if doc_id not in self.storage.keys():
-                continue
-            del self.storage[doc_id]
+            if self.storage.pop(doc_id, None) is not None:
+                self._table_text_cache.pop(doc_id, None)
+                self._corpus_version += 1
 
     def bm25_retrieval(
         self, query: str, filters: Optional[Dict[str, Any]] = None, top_k: int = 10, scale_score: bool = False
@@ -161,61 +171,37 @@ class InMemoryDocumentStore:
         if not query:
             raise ValueError("Query should be a non-empty string")
 
-        content_type_filter = {
-            "operator": "OR",
-            "conditions": [
-                {"field": "content", "operator": "!=", "value": None},
-                {"field": "dataframe", "operator": "!=", "value": None},
-            ],
-        }
         if filters:
-            if "operator" not in filters:
-                filters = convert(filters)
-            filters = {"operator": "AND", "conditions": [content_type_filter, filters]}
+            all_documents, bm25_scorer = self._build_bm25_index(filters=filters)
         else:
-            filters = content_type_filter
-        all_documents = self.filter_documents(filters=filters)
-
-        # Lowercase all documents
-        lower_case_documents = []
-        for doc in all_documents:
-            if doc.content is None and doc.dataframe is None:
-                logger.info(
-                    "Document '{document_id}' has no text or dataframe content. Skipping it.", document_id=doc.id
-                )
+            # Without filters the index only depends on the stored documents, so it can be reused across queries
+            cache_key = (self._corpus_version, self.bm25_algorithm, dict(self.bm25_parameters))
+            if self._bm25_cache is not None and self._bm25_cache[0] == cache_key:
+                _, all_documents, bm25_scorer = self._bm25_cache
             else:
-                if doc.content is not None:
-                    lower_case_documents.append(doc.content.lower())
-                    if doc.dataframe is not None:
-                        logger.warning(
-                            "Document '{document_id}' has both text and dataframe content. "
-                            "Using text content and skipping dataframe content.",
-                            document_id=doc.id,
-                        )
-                        continue
-                if doc.dataframe is not None:
-                    str_content = doc.dataframe.astype(str)
-                    csv_content = str_content.to_csv(index=False)
-                    lower_case_documents.append(csv_content.lower())
-
-        # Tokenize the entire content of the DocumentStore
-        tokenized_corpus = [
-            self.tokenizer(doc) for doc in tqdm(lower_case_documents, unit=" docs", desc="Ranking by BM25...")
-        ]
-        if len(tokenized_corpus) == 0:
+                all_documents, bm25_scorer = self._build_bm25_index()
+                self._bm25_cache = (cache_key, all_documents, bm25_scorer)
+
+        if bm25_scorer is None:
             logger.info("No documents found for BM25 retrieval. Returning empty list.")
             return []
 
-        # initialize BM25
-        bm25_scorer = self.bm25_algorithm(tokenized_corpus, **self.bm25_parameters)
         # tokenize query
-        tokenized_query = self.tokenizer(query.lower())
+        tokenized_query = self._tokenize(query)
         # get scores for the query against the corpus
-        docs_scores = bm25_scorer.get_scores(tokenized_query)
+        docs_scores = np.asarray(bm25_scorer.get_scores(tokenized_query), dtype=np.float64)
         if scale_score:
-            docs_scores = [expit(float(score / BM25_SCALING_FACTOR)) for score in docs_scores]
-        # get the last top_k indexes and reverse them
-        top_docs_positions = np.argsort(docs_scores)[-top_k:][::-1]
+            docs_scores = expit(docs_scores / BM25_SCALING_FACTOR)
+        # only documents scoring at least as high as the top_k-th best one can be returned, so there's no need to
+        # sort the scores of the whole corpus
+        if top_k < len(docs_scores):
+            kth_score = np.partition(docs_scores, -top_k)[-top_k]
+            candidate_positions = np.flatnonzero(docs_scores >= kth_score)
+        else:
+            candidate_positions = np.arange(len(docs_scores))
+        # sort by descending score, ties go to the document stored last
+        candidates_order = np.lexsort((-candidate_positions, -docs_scores[candidate_positions]))
+        top_docs_positions = candidate_positions[candidates_order][:top_k]
 
         # BM25Okapi can return meaningful negative values, so they should not be filtered out when scale_score is False.
         # It's the only algorithm supported by rank_bm25 at the time of writing (2024) that can return negative scores.
@@ -226,15 +212,87 @@ class InMemoryDocumentStore:
         return_documents = []
         for i in top_docs_positions:
             doc = all_documents[i]
-            score = docs_scores[i]
+            score = float(docs_scores[i])
             if not negatives_are_valid and score <= 0.0:
                 continue
-            doc_fields = doc.to_dict()
-            doc_fields["score"] = score
-            return_document = Document.from_dict(doc_fields)
+            # Copy the mutable fields so that editing a returned Document doesn't change the stored one
+            return_document = replace(
+                doc,
+                score=score,
+                meta=deepcopy(doc.meta),
+                dataframe=doc.dataframe.copy() if doc.dataframe is not None else None,
+                blob=deepcopy(doc.blob),
+                embedding=list(doc.embedding) if doc.embedding is not None else None,
+                sparse_embedding=deepcopy(doc.sparse_embedding),
+            )
             return_documents.append(return_document)
         return return_documents
 
+    def _build_bm25_index(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Document], Optional[rank_bm25.BM25]]:
+        """
+        Tokenizes the documents matching the filters and fits the BM25 algorithm on them.
+
+        :param filters: A dictionary with filters to narrow down the documents to index.
+        :returns: The indexed Documents and the fitted BM25 scorer, or `None` if no Documents match.
+        """
+        content_type_filter = {
+            "operator": "OR",
+            "conditions": [
+                {"field": "content", "operator": "!=", "value": None},
+                {"field": "dataframe", "operator": "!=", "value": None},
+            ],
+        }
+        if filters:
+            if "operator" not in filters:
+                filters = convert(filters)
+            filters = {"operator": "AND", "conditions": [content_type_filter, filters]}
+        else:
+            filters = content_type_filter
+        all_documents = self.filter_documents(filters=filters)
+        if not all_documents:
+            return [], None
+
+        # BM25 goes through the corpus only once, so tokenize the Documents lazily and let each token list be freed
+        # as soon as its term frequencies have been counted
+        tokenized_corpus = (
+            self._tokenize_doc(doc) for doc in tqdm(all_documents, unit=" docs", desc="Ranking by BM25...")
+        )
+        return all_documents, self.bm25_algorithm(tokenized_corpus, **self.bm25_parameters)
+
+    def _tokenize_doc(self, doc: Document) -> List[str]:
+        """
+        Tokenizes the text or dataframe content of a Document for BM25 retrieval.
+
+        :param doc: The Document to tokenize.
+        :returns: The list of tokens.
+        """
+        if doc.content is not None:
+            if doc.dataframe is not None:
+                logger.warning(
+                    "Document '{document_id}' has both text and dataframe content. "
+                    "Using text content and skipping dataframe content.",
+                    document_id=doc.id,
+                )
+            return self._tokenize(doc.content)
+        table_text = self._table_text_cache.get(doc.id)
+        if table_text is None:
+            # Only the cell values and column names matter for tokenization, so there's no need for a full CSV export
+            str_content = doc.dataframe.astype(str)  # type: ignore[union-attr]
+            table_text = " ".join([*map(str, str_content.columns), *str_content.to_numpy().ravel()])
+            self._table_text_cache[doc.id] = table_text
+        return self._tokenize(table_text)
+
+    def _tokenize(self, text: str) -> List[str]:
+        """
+        Tokenizes a text for BM25 retrieval and lowercases the tokens.
+
+        :param text: The text to tokenize.
+        :returns: The list of lowercased tokens.
+        """
+        return [token.lower() for token in self.tokenizer(text)]
+
     def embedding_retrieval(
         self,
         query_embedding: List[float],
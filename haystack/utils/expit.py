@@ -1,6 +1,18 @@
+from typing import Union, overload
+
 import numpy as np
 
 
+@overload
 def expit(x: float) -> float:
+    ...
+
+
+@overload
+def expit(x: np.ndarray) -> np.ndarray:
+    ...
+
+
+def expit(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """Compute logistic sigmoid function. Maps input values to a range between 0 and 1"""
     return 1 / (1 + np.exp(-x))
@@ -30,6 +30,7 @@ class TestSimilarityRanker:
                 "calibration_factor": 1.0,
                 "score_threshold": None,
                 "model_kwargs": {"device_map": ComponentDevice.resolve_device(None).to_hf()},
+                "batch_size": 16,
             },
         }
 
@@ -45,6 +46,7 @@ class TestSimilarityRanker:
             calibration_factor=None,
             score_threshold=0.01,
             model_kwargs={"torch_dtype": torch.float16},
+            batch_size=32,
         )
         data = component.to_dict()
         assert data == {
@@ -65,6 +67,7 @@ class TestSimilarityRanker:
                     "torch_dtype": "torch.float16",
                     "device_map": ComponentDevice.from_str("cuda:0").to_hf(),
                 },  # torch_dtype is correctly serialized
+                "batch_size": 32,
             },
         }
 
@@ -99,6 +102,7 @@ class TestSimilarityRanker:
                     "bnb_4bit_compute_dtype": "torch.bfloat16",
                     "device_map": ComponentDevice.resolve_device(None).to_hf(),
                 },
+                "batch_size": 16,
             },
         }
 
@@ -129,6 +133,7 @@ class TestSimilarityRanker:
                 "calibration_factor": 1.0,
                 "score_threshold": None,
                 "model_kwargs": {"device_map": expected},
+                "batch_size": 16,
             },
         }
 
@@ -178,6 +183,9 @@ class TestSimilarityRanker:
             model="model", meta_fields_to_embed=["meta_field"], embedding_separator="\n"
         )
         embedder.model = MagicMock()
+        embedder.model.return_value = SequenceClassifierOutput(
+            loss=None, logits=torch.FloatTensor([[0.0]] * 5), hidden_states=None, attentions=None
+        )
         embedder.tokenizer = MagicMock()
         embedder.device = MagicMock()
         embedder.warm_up()
@@ -208,6 +216,9 @@ class TestSimilarityRanker:
             model="model", query_prefix="query_instruction: ", document_prefix="document_instruction: "
         )
         embedder.model = MagicMock()
+        embedder.model.return_value = SequenceClassifierOutput(
+            loss=None, logits=torch.FloatTensor([[0.0]] * 5), hidden_states=None, attentions=None
+        )
         embedder.tokenizer = MagicMock()
         embedder.device = MagicMock()
         embedder.warm_up()
@@ -260,6 +271,35 @@ class TestSimilarityRanker:
         out = embedder.run(query="test", documents=documents)
         assert len(out["documents"]) == 1
 
+    def test_run_in_batches(self):
+        embedder = TransformersSimilarityRanker(model="model", scale_score=False, batch_size=2)
+        embedder.model = MagicMock()
+        embedder.model.side_effect = [
+            SequenceClassifierOutput(loss=None, logits=torch.FloatTensor([[0.1], [0.5]]), hidden_states=None),
+            SequenceClassifierOutput(loss=None, logits=torch.FloatTensor([[0.3], [0.9]]), hidden_states=None),
+            SequenceClassifierOutput(loss=None, logits=torch.FloatTensor([[0.7]]), hidden_states=None),
+        ]
+        embedder.tokenizer = MagicMock()
+        embedder.device = MagicMock()
+
+        documents = [Document(content=f"document number {i}") for i in range(5)]
+        out = embedder.run(query="test", documents=documents)
+
+        assert embedder.tokenizer.call_count == 3
+        assert embedder.tokenizer.call_args_list[2].args[0] == [["test", "document number 4"]]
+        assert [doc.content for doc in out["documents"]] == [
+            "document number 3",
+            "document number 4",
+            "document number 1",
+            "document number 2",
+            "document number 0",
+        ]
+
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    def test_init_invalid_batch_size(self, batch_size):
+        with pytest.raises(ValueError, match="batch_size must be > 0"):
+            TransformersSimilarityRanker(model="model", batch_size=batch_size)
+
     def test_device_map_and_device_raises(self, caplog):
         with caplog.at_level(logging.WARNING):
             _ = TransformersSimilarityRanker(
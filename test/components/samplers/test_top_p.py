@@ -63,6 +63,29 @@ class TestTopPSampler:
 
         assert [doc.score for doc in docs_filtered] == sorted([doc.score for doc in docs], reverse=True)
 
+    def test_run_single_document(self):
+        """
+        Test if the component returns a single document regardless of top_p.
+        """
+        sampler = TopPSampler(top_p=0.01)
+        docs = [Document(content="Berlin", score=-10.6)]
+        output = sampler.run(documents=docs)
+        assert output["documents"] == docs
+
+    def test_run_large_scores(self):
+        """
+        Test if the component runs correctly with scores large enough to overflow a naive softmax.
+        """
+        sampler = TopPSampler(top_p=0.99)
+        docs = [
+            Document(content="Berlin", score=1000.0),
+            Document(content="Belgrade", score=999.0),
+            Document(content="Sarajevo", score=10.0),
+        ]
+        output = sampler.run(documents=docs)
+        docs_filtered = output["documents"]
+        assert [doc.content for doc in docs_filtered] == ["Berlin"]
+
     #  Returns an empty list if no documents are provided
 
     def test_returns_empty_list_if_no_documents_are_provided(self):
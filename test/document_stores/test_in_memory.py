@@ -8,6 +8,7 @@ from haystack_bm25 import rank_bm25
 from haystack import Document
 from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
 from haystack.document_stores.in_memory import InMemoryDocumentStore
+from haystack.document_stores.types import DuplicatePolicy
 from haystack.testing.document_store import DocumentStoreBaseTests
 
 
@@ -62,7 +63,7 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
             },
         }
         store = InMemoryDocumentStore.from_dict(data)
-        mock_regex.compile.assert_called_with("custom_regex")
+        mock_regex.compile.assert_called_with("custom_regex", mock_regex.IGNORECASE)
         assert store.tokenizer
         assert store.bm25_algorithm.__name__ == "BM25Plus"
         assert store.bm25_parameters == {"key": "value"}
@@ -153,6 +154,47 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         assert len(results) == 1
         assert results[0].content == "Python is a popular programming language"
 
+    def test_bm25_retrieval_reuses_index_until_documents_change(self, document_store: InMemoryDocumentStore):
+        document_store.write_documents([Document(content="Python is a popular programming language")])
+
+        document_store.bm25_retrieval(query="Python", top_k=1)
+        _, _, bm25_scorer = document_store._bm25_cache
+        document_store.bm25_retrieval(query="Java", top_k=1)
+        assert document_store._bm25_cache[2] is bm25_scorer
+
+        document_store.write_documents([Document(content="Java is a popular programming language")])
+        results = document_store.bm25_retrieval(query="Java", top_k=1)
+        assert document_store._bm25_cache[2] is not bm25_scorer
+        assert results[0].content == "Java is a popular programming language"
+
+        document_store.delete_documents([results[0].id])
+        results = document_store.bm25_retrieval(query="Java", top_k=1)
+        assert len(results) == 0
+
+    def test_bm25_retrieval_does_not_change_stored_documents(self, document_store: InMemoryDocumentStore):
+        doc = Document(content="Python is a popular programming language", meta={"lang": "en"})
+        document_store.write_documents([doc])
+
+        results = document_store.bm25_retrieval(query="Python", top_k=1)
+        assert results[0].id == doc.id
+        assert results[0].meta == {"lang": "en"}
+        assert results[0].score > 0.0
+        assert document_store.filter_documents()[0].score is None
+
+        results[0].meta["injected"] = True
+        assert document_store.filter_documents()[0].meta == {"lang": "en"}
+
+    def test_bm25_retrieval_does_not_share_dataframes_with_stored_documents(
+        self, document_store: InMemoryDocumentStore
+    ):
+        table_content = pd.DataFrame({"language": ["Python", "Java"], "use": ["Data Science", "Web Development"]})
+        table_doc = Document(dataframe=table_content.copy())
+        document_store.write_documents([table_doc, Document(content="Gardening")])
+
+        results = document_store.bm25_retrieval(query="Java", top_k=1)
+        results[0].dataframe.loc[0, "language"] = "Rust"
+        assert document_store.storage[table_doc.id].dataframe.equals(table_content)
+
     def test_bm25_retrieval_with_scale_score(self, document_store: InMemoryDocumentStore):
         docs = [Document(content="Python programming"), Document(content="Java programming")]
         document_store.write_documents(docs)
@@ -211,6 +253,18 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         assert isinstance(df, pd.DataFrame)
         assert df.equals(table_content)
 
+    def test_bm25_retrieval_with_overwritten_table_content(self, document_store: InMemoryDocumentStore):
+        python_table = pd.DataFrame({"language": ["Python"], "use": ["Data Science"]})
+        java_table = pd.DataFrame({"language": ["Java"], "use": ["Web Development"]})
+        document_store.write_documents([Document(id="table", dataframe=python_table), Document(content="Gardening")])
+        results = document_store.bm25_retrieval(query="Python", top_k=1)
+        assert results[0].id == "table"
+
+        document_store.write_documents([Document(id="table", dataframe=java_table)], policy=DuplicatePolicy.OVERWRITE)
+        results = document_store.bm25_retrieval(query="Java", top_k=1)
+        assert results[0].id == "table"
+        assert results[0].dataframe.equals(java_table)
+
     def test_bm25_retrieval_with_text_and_table_content(self, document_store: InMemoryDocumentStore, caplog):
         table_content = pd.DataFrame({"language": ["Python", "Java"], "use": ["Data Science", "Web Development"]})
         document = Document(content="Gardening", dataframe=table_content)